@@ -4,14 +4,16 @@ CLI entrypoint for Fruit Dealer Game.
 Handles main menu rendering and routing to game actions.
 """
 
+import gzip
 import json
+import zlib
 
 from loguru import logger
-from rich.prompt import Prompt
 
 from commands import game_loop
 from game_setup import start_new_game
-from persistence import store_game, load_game, GAME_FILE
+import persistence
+from persistence import store_game, load_game
 from ui import console, render_error, render_success, render_main_menu, render_game_view
 
 
@@ -28,7 +30,7 @@ def cli() -> None:
 
     Menu commands:
         - 1: Start new game (validates player name, saves to disk)
-        - 2: Load game (handles FileNotFoundError, JSONDecodeError, KeyError)
+        - 2: Load game (handles missing, corrupted and incompatible saves)
         - 3: Exit application
     """
     logger.info("Starting Fruit Dealer Game")
@@ -36,15 +38,15 @@ def cli() -> None:
     while True:
         render_main_menu()
 
-        # Validate menu input
+        # Validate menu input; console.input skips Prompt's per-call setup
         while True:
             try:
-                cmd = int(Prompt.ask("[bold blue]Enter a command (1-3)[/bold blue]"))
-                if cmd not in (1, 2, 3):
-                    raise ValueError
-                break
+                cmd = int(console.input("[bold blue]Enter a command (1-3):[/bold blue] "))
+                if cmd in (1, 2, 3):
+                    break
             except ValueError:
-                render_error("Invalid choice.", hint="Enter 1, 2, or 3.")
+                pass
+            render_error("Invalid choice.", hint="Enter 1, 2, or 3.")
 
         # Handle menu actions
         if cmd == 1:
@@ -58,8 +60,8 @@ def cli() -> None:
                 render_success("Game loaded successfully!")
                 game_loop(engine)
             except FileNotFoundError:
-                render_error("No save file found.", hint=f"Expected: {GAME_FILE}")
-            except json.JSONDecodeError:
+                render_error("No save file found.", hint=f"Expected: {persistence.GAME_FILE}")
+            except (json.JSONDecodeError, gzip.BadGzipFile, EOFError, zlib.error):
                 render_error("Save file is corrupted.", hint="Start a new game.")
             except KeyError as e:
                 render_error(
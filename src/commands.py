@@ -4,20 +4,13 @@ Command parsing and execution for Fruit Dealer Game.
 Handles the game loop, command parsing, and command execution.
 """
 
+from typing import Callable
+
 from rich.prompt import Prompt
 
 from game_engine import GameEngine
 from persistence import store_game
-from ui import console, render_error, render_success, render_game_view
-
-
-# Available commands
-COMMANDS = {"help", "buy", "sell", "travel", "status", "save", "quit", "exit"}
-
-
-def pluralize(word: str, count: int) -> str:
-    """Return singular or plural form based on count."""
-    return word if count == 1 else word + "s"
+from ui import console, render_error, render_success, render_game_view, render_help_menu
 
 
 def parse_command(cmd: str) -> tuple[str, list[str]] | None:
@@ -35,17 +28,15 @@ def parse_command(cmd: str) -> tuple[str, list[str]] | None:
     Returns:
         (command, args) tuple or None if command is invalid.
     """
-    if not cmd:
-        return None
-
-    parts = cmd.strip().split()
+    # str.split() with no separator already drops surrounding whitespace
+    parts = cmd.split()
     if not parts:
         return None
 
     command = parts[0].lower()
-    args = parts[1:] if len(parts) > 1 else []
+    args = parts[1:]
 
-    if command not in COMMANDS:
+    if command not in _HANDLERS:
         render_error(
             "Invalid command",
             hint="Try typing 'help' to see available commands."
@@ -55,9 +46,124 @@ def parse_command(cmd: str) -> tuple[str, list[str]] | None:
     return (command, args)
 
 
-def execute_command(engine: GameEngine, command: str, args: list[str]) -> bool:
+def _handle_help(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Show the command list below the current view, so no redraw."""
+    render_help_menu()
+    return True, False
+
+
+def _handle_status(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Show status by requesting a redraw of the game view."""
+    return True, True
+
+
+def _handle_save(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Persist the current game to disk."""
+    store_game(engine)
+    render_success("Game saved!")
+    return True, False
+
+
+def _handle_exit(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Leave the game loop and return to the main menu."""
+    return False, False
+
+
+def _handle_buy(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Handle 'buy <fruit> <quantity>'."""
+    if len(args) != 2:
+        render_error("Usage: buy <fruit> <quantity>", hint="Example: buy apple 5")
+        return True, False
+
+    fruit, qty_str = args
+    if not qty_str.isdecimal():
+        render_error("Quantity must be a number", hint="Example: buy apple 5")
+        return True, False
+
+    fruit_name = engine.resolve_fruit_name(fruit)
+    if fruit_name is None:
+        render_error(f"Unknown fruit: {fruit}", hint="Pick a fruit from the market prices.")
+        return True, False
+
+    qty = int(qty_str)
+    try:
+        engine.buy(fruit_name, qty)
+    except ValueError as e:
+        render_error(str(e))
+        return True, False
+
+    render_success(f"Bought {qty} {fruit_name if qty == 1 else fruit_name + 's'}!")
+    return True, True
+
+
+def _handle_sell(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Handle 'sell <fruit> <quantity>'."""
+    if len(args) != 2:
+        render_error("Usage: sell <fruit> <quantity>", hint="Example: sell banana 3")
+        return True, False
+
+    fruit, qty_str = args
+    if not qty_str.isdecimal():
+        render_error("Quantity must be a number", hint="Example: sell banana 3")
+        return True, False
+
+    fruit_name = engine.resolve_fruit_name(fruit)
+    if fruit_name is None:
+        render_error(f"Unknown fruit: {fruit}", hint="Pick a fruit from the market prices.")
+        return True, False
+
+    qty = int(qty_str)
+    try:
+        engine.sell(fruit_name, qty)
+    except ValueError as e:
+        render_error(str(e))
+        return True, False
+
+    render_success(f"Sold {qty} {fruit_name if qty == 1 else fruit_name + 's'}!")
+    return True, True
+
+
+def _handle_travel(engine: GameEngine, args: list[str]) -> tuple[bool, bool]:
+    """Handle 'travel <city>'."""
+    if len(args) != 1:
+        render_error("Usage: travel <city>", hint="Example: travel Tampere")
+        return True, False
+
+    city_name = engine.resolve_city_name(args[0])
+    if city_name is None:
+        render_error(f"Unknown city: {args[0]}", hint="Example: travel Tampere")
+        return True, False
+
+    try:
+        engine.travel(city_name)
+    except ValueError as e:
+        render_error(str(e))
+        return True, False
+
+    render_success(f"Traveled to {city_name}!")
+    return True, True
+
+
+# Command name -> handler(engine, args).
+# Handlers return (keep_running, redraw): keep_running=False exits the loop,
+# redraw=True means game state changed and the view must be rendered again.
+_HANDLERS: dict[str, Callable[[GameEngine, list[str]], tuple[bool, bool]]] = {
+    "help": _handle_help,
+    "buy": _handle_buy,
+    "sell": _handle_sell,
+    "travel": _handle_travel,
+    "status": _handle_status,
+    "save": _handle_save,
+    "quit": _handle_exit,
+    "exit": _handle_exit,
+}
+
+
+def execute_command(
+    engine: GameEngine, command: str, args: list[str]
+) -> tuple[bool, bool]:
     """
-    Execute a parsed command.
+    Execute a parsed command by dispatching to its handler.
 
     Args:
         engine: GameEngine with current game state.
@@ -65,98 +171,47 @@ def execute_command(engine: GameEngine, command: str, args: list[str]) -> bool:
         args: Command arguments.
 
     Returns:
-        True to continue game loop, False to exit to main menu.
+        (keep_running, redraw) tuple. keep_running is False to exit to the
+        main menu; redraw is True when the game view must be re-rendered.
     """
-    if command == "help":
-        # TODO: render_help_menu()
-        return True
-
-    if command == "status":
-        # Game view is rendered at the start of each loop
-        return True
-
-    if command == "save":
-        store_game(engine)
-        render_success("Game saved!")
-        return True
-
-    if command in ("quit", "exit"):
-        return False
-
-    # Commands with args
-    if command == "buy":
-        if len(args) != 2:
-            render_error("Usage: buy <fruit> <quantity>", hint="Example: buy apple 5")
-            return True
-
-        fruit, qty_str = args
-        if not qty_str.isdigit():
-            render_error("Quantity must be a number", hint="Example: buy apple 5")
-            return True
-
-        try:
-            qty = int(qty_str)
-            engine.buy(fruit.capitalize(), qty)
-            render_success(f"Bought {qty} {pluralize(fruit, qty)}!")
-        except ValueError as e:
-            render_error(str(e))
-        return True
-
-    if command == "sell":
-        if len(args) != 2:
-            render_error("Usage: sell <fruit> <quantity>", hint="Example: sell banana 3")
-            return True
-
-        fruit, qty_str = args
-        if not qty_str.isdigit():
-            render_error("Quantity must be a number", hint="Example: sell banana 3")
-            return True
-
-        try:
-            qty = int(qty_str)
-            engine.sell(fruit.capitalize(), qty)
-            render_success(f"Sold {qty} {pluralize(fruit, qty)}!")
-        except ValueError as e:
-            render_error(str(e))
-        return True
-
-    if command == "travel":
-        if len(args) != 1:
-            render_error("Usage: travel <city>", hint="Example: travel Tampere")
-            return True
-
-        try:
-            engine.travel(args[0].capitalize())
-            render_success(f"Traveled to {args[0].capitalize()}!")
-        except ValueError as e:
-            render_error(str(e))
-        return True
-
-    return True  # Unknown command - continue
+    handler = _HANDLERS.get(command)
+    if handler is None:
+        render_error(
+            "Invalid command",
+            hint="Try typing 'help' to see available commands."
+        )
+        return True, False
+    return handler(engine, args)
 
 
 def game_loop(engine: GameEngine) -> None:
     """
     Main game loop. Renders view, accepts commands, updates state.
 
+    The view is only re-rendered after commands that change game state
+    (or 'status'); help, save and invalid input leave the last frame as is.
+
     Returns when player enters 'quit' or 'exit'.
 
     Args:
         engine: GameEngine with current game state.
     """
+    redraw = True
     while True:
-        render_game_view(engine)
+        if redraw:
+            render_game_view(engine)
 
         raw_cmd = Prompt.ask("[bold blue]Command[/bold blue]")
 
         parsed = parse_command(raw_cmd)
         if parsed is None:
+            redraw = False
             continue
 
         command, args = parsed
 
-        should_continue = execute_command(engine, command, args)
+        keep_running, redraw = execute_command(engine, command, args)
 
-        if not should_continue:
+        if not keep_running:
             return
 
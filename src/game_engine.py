@@ -34,6 +34,11 @@ class GameEngine:
         """
         self.game = game
         self.pricing = PricingSystem(game)
+        # Name indexes so per-action lookups are O(1) instead of list scans
+        self._cities_by_name = {c.name: c for c in game.cities}
+        # Case-insensitive input -> canonical name, for user-typed commands
+        self._fruit_names_by_lower = {f.name.lower(): f.name for f in game.fruits}
+        self._city_names_by_lower = {c.name.lower(): c.name for c in game.cities}
 
 
     @property
@@ -47,6 +52,43 @@ class GameEngine:
         return self.game.player
 
 
+    @property
+    def current_market(self) -> Market | None:
+        """
+        Get the market of the player's current city.
+        
+        Returns:
+            The Market object, or None if the current city has no market
+        """
+        return self.pricing.get_market(self.player.current_city.name)
+
+
+    def resolve_fruit_name(self, name: str) -> str | None:
+        """
+        Map user input to a fruit's canonical name, ignoring case.
+        
+        Args:
+            name: Fruit name as typed (e.g., "apple", "APPLE")
+            
+        Returns:
+            The canonical fruit name (e.g., "Apple"), or None if unknown
+        """
+        return self._fruit_names_by_lower.get(name.lower())
+
+
+    def resolve_city_name(self, name: str) -> str | None:
+        """
+        Map user input to a city's canonical name, ignoring case.
+        
+        Args:
+            name: City name as typed (e.g., "tampere")
+            
+        Returns:
+            The canonical city name (e.g., "Tampere"), or None if unknown
+        """
+        return self._city_names_by_lower.get(name.lower())
+
+
     def buy(self, fruit_name: str, quantity: int) -> bool:
         """
         Buy fruits from the current city's market.
@@ -62,19 +104,19 @@ class GameEngine:
             ValueError: If fruit is not available in current market
             ValueError: If player doesn't have enough money
         """
-        market = self._get_current_market()
-        if fruit_name not in market.prices:
+        prices = self._get_current_market().prices
+        if fruit_name not in prices:
             raise ValueError(f"Fruit not found in market: {fruit_name}")
 
-        price = market.prices[fruit_name]
-        total_cost = price * quantity
+        total_cost = prices[fruit_name] * quantity
 
-        if total_cost > self.player.money:
+        player = self.game.player
+        if total_cost > player.money:
             raise ValueError(f"Not enough funds to buy {quantity} {fruit_name}")
 
-        self.player.money -= total_cost
-        current = self.player.inventory.get(fruit_name, 0)
-        self.player.inventory[fruit_name] = current + quantity
+        player.money -= total_cost
+        inventory = player.inventory
+        inventory[fruit_name] = inventory.get(fruit_name, 0) + quantity
         return True
 
 
@@ -93,17 +135,18 @@ class GameEngine:
             ValueError: If fruit is not available in current market
             ValueError: If player doesn't have enough inventory
         """
-        market = self._get_current_market()
-        if fruit_name not in market.prices:
+        prices = self._get_current_market().prices
+        if fruit_name not in prices:
             raise ValueError(f"Fruit not found in market: {fruit_name}")
 
-        current_qty = self.player.inventory.get(fruit_name, 0)
+        player = self.game.player
+        inventory = player.inventory
+        current_qty = inventory.get(fruit_name, 0)
         if quantity > current_qty:
             raise ValueError(f"Not enough {fruit_name} to sell {quantity}")
 
-        price = market.prices[fruit_name]
-        self.player.money += price * quantity
-        self.player.inventory[fruit_name] = current_qty - quantity
+        player.money += prices[fruit_name] * quantity
+        inventory[fruit_name] = current_qty - quantity
         return True
 
 
@@ -124,8 +167,8 @@ class GameEngine:
             ValueError: If city doesn't exist in the game
             ValueError: If player doesn't have enough money for travel cost
         """
-        city = next((c for c in self.game.cities if c.name == city_name), None)
-        if not city:
+        city = self._cities_by_name.get(city_name)
+        if city is None:
             raise ValueError(f"City not found: {city_name}")
 
         travel_cost = 50
@@ -168,11 +211,7 @@ class GameEngine:
         Raises:
             ValueError: If no market exists for the current city
         """
-        market = next(
-            (m for m in self.game.markets
-             if m.city.name == self.player.current_city.name),
-            None
-        )
-        if not market:
+        market = self.current_market
+        if market is None:
             raise ValueError(f"No market for {self.player.current_city.name}")
         return market
\ No newline at end of file
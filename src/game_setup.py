@@ -5,6 +5,7 @@ Handles creating new games with initial data and player setup.
 """
 
 import re
+import string
 
 from rich.prompt import Prompt
 
@@ -13,17 +14,53 @@ from game_engine import GameEngine
 from ui import console, render_error, render_success
 
 
-# Valid player name pattern: 2-20 chars, letters/spaces/hyphens
-NAME_PATTERN = re.compile(r"^[A-Za-zÀ-ÖØ-öø-ÿ \-]{2,20}$")
+# Valid player name pattern: 2-20 chars, letters/spaces/hyphens.
+# Used with fullmatch(), so no anchors; no IGNORECASE, so no case folding.
+NAME_PATTERN = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ \-]{2,20}")
+
+# Deletes every allowed ASCII name character; a valid ASCII name translates to "".
+_ASCII_NAME_CHARS = str.maketrans("", "", string.ascii_letters + " -")
+
+# Fruit and city catalog, built once at import. These are never mutated
+# during play, so every new game shares the same instances.
+DEFAULT_FRUITS = (
+    Fruit(name="Apple", base_price=100, emoji="🍎"),
+    Fruit(name="Banana", base_price=80, emoji="🍌"),
+    Fruit(name="Cherry", base_price=150, emoji="🍒"),
+    Fruit(name="Grape", base_price=120, emoji="🍇"),
+    Fruit(name="Orange", base_price=110, emoji="🍊"),
+)
+
+DEFAULT_CITIES = (
+    City(name="Helsinki", position=(0, 0), specialties={"Apple": 1.1, "Banana": 1.0}),
+    City(name="Tampere", position=(1, 2), specialties={"Cherry": 0.9, "Banana": 1.05}),
+    City(name="Turku", position=(2, 1), specialties={"Orange": 0.8, "Grape": 1.2}),
+    City(name="Oulu", position=(3, 3), specialties={"Banana": 0.95, "Apple": 1.15}),
+    City(name="Pori", position=(0, 3), specialties={"Apple": 0.8, "Grape": 1.05}),
+)
+
+
+def _is_valid_name(name: str) -> bool:
+    """
+    Check a player name against the 2-20 letters/spaces/hyphens rule.
+
+    Plain ASCII names are checked with one str.translate pass; only names
+    containing accented characters go through NAME_PATTERN.
+    """
+    if not 2 <= len(name) <= 20:
+        return False
+    if name.isascii():
+        return not name.translate(_ASCII_NAME_CHARS)
+    return NAME_PATTERN.fullmatch(name) is not None
 
 
 def setup_data(player_name: str) -> Game:
     """
     Create initial game data for a fresh run.
 
-    Builds fruits, cities with specialty modifiers, empty markets (prices filled
-    by PricingSystem), and a starting player positioned in the first city with
-    a default bankroll.
+    Reuses the shared fruit and city catalog, and builds fresh empty markets
+    (prices filled by PricingSystem) and a starting player positioned in the
+    first city with a default bankroll.
 
     Args:
         player_name: Validated name assigned to the new player.
@@ -31,21 +68,8 @@ def setup_data(player_name: str) -> Game:
     Returns:
         Game: Populated with fruits, cities, markets, player, and current day.
     """
-    fruits = [
-        Fruit(name="Apple", base_price=100, emoji="🍎"),
-        Fruit(name="Banana", base_price=80, emoji="🍌"),
-        Fruit(name="Cherry", base_price=150, emoji="🍒"),
-        Fruit(name="Grape", base_price=120, emoji="🍇"),
-        Fruit(name="Orange", base_price=110, emoji="🍊"),
-    ]
-
-    cities = [
-        City(name="Helsinki", position=(0, 0), specialties={"Apple": 1.1, "Banana": 1.0}),
-        City(name="Tampere", position=(1, 2), specialties={"Cherry": 0.9, "Banana": 1.05}),
-        City(name="Turku", position=(2, 1), specialties={"Orange": 0.8, "Grape": 1.2}),
-        City(name="Oulu", position=(3, 3), specialties={"Banana": 0.95, "Apple": 1.15}),
-        City(name="Pori", position=(0, 3), specialties={"Apple": 0.8, "Grape": 1.05}),
-    ]
+    fruits = list(DEFAULT_FRUITS)
+    cities = list(DEFAULT_CITIES)
 
     markets = [Market(city=c, prices={}) for c in cities]
 
@@ -78,7 +102,7 @@ def start_new_game(player_name: str | None = None) -> GameEngine:
             player_name = Prompt.ask("[bold blue]Enter your player name[/bold blue]")
         player_name = player_name.strip()
 
-        if NAME_PATTERN.match(player_name):
+        if _is_valid_name(player_name):
             break
 
         render_error(
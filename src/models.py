@@ -8,7 +8,7 @@ Coordinates = Tuple[int, int]
 Emoji = str
 
 
-@dataclass
+@dataclass(slots=True)
 class Fruit:
     name: str
     base_price: Money
@@ -16,27 +16,27 @@ class Fruit:
     description: str = field(default="No description provided")
 
 
-@dataclass
+@dataclass(slots=True)
 class City:
     name: str
     position: Coordinates
     specialties: Dict[str, float]  # fruit -> price modifier
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     money: Money
     inventory: Dict[str, int]
     current_city: City  # was: city
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     city: City
-    prices: Dict[str, Money]  # fruit -> price
+    prices: Dict[str, Money]  # fruit -> price, in alphabetical fruit order
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     fruits: List[Fruit]
     cities: List[City]
@@ -5,8 +5,10 @@ Handles saving and loading game state to/from JSON files.
 All money values are stored as cents (int) to avoid floating point issues.
 """
 
+import gzip
 import json
-from dataclasses import asdict
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
@@ -20,26 +22,47 @@ from game_engine import GameEngine
 # Default save file location
 GAME_FILE = Path(__file__).resolve().parent / "game.json"
 
+# First two bytes of every gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
 
-def serialize_game(engine: GameEngine) -> Dict:
+
+def serialize_game(engine: GameEngine, created_at: datetime | None = None) -> Dict:
     """
     Convert the current game engine state into a JSON-friendly dict.
 
     Notes:
+        - Fruits and cities are built as plain dicts (no asdict deep copy).
         - Markets are stored by city name with price mapping.
         - Player current city is stored by name for lookup on load.
         - Timestamp is informational.
 
     Args:
         engine: GameEngine with current game state.
+        created_at: Optional save timestamp. Defaults to now.
 
     Returns:
         Dict ready for JSON serialization.
     """
     player_city = engine.player.current_city.name
+    created_at = created_at or datetime.now()
     return {
-        "fruits": [asdict(fruit) for fruit in engine.game.fruits],
-        "cities": [asdict(city) for city in engine.game.cities],
+        "fruits": [
+            {
+                "name": fruit.name,
+                "base_price": fruit.base_price,
+                "emoji": fruit.emoji,
+                "description": fruit.description,
+            }
+            for fruit in engine.game.fruits
+        ],
+        "cities": [
+            {
+                "name": city.name,
+                "position": list(city.position),
+                "specialties": city.specialties,
+            }
+            for city in engine.game.cities
+        ],
         "markets": [
             {"city": market.city.name, "prices": market.prices}
             for market in engine.game.markets
@@ -51,7 +74,7 @@ def serialize_game(engine: GameEngine) -> Dict:
             "current_city": player_city,
         },
         "current_day": engine.game.current_day,
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "created_at": created_at.isoformat(sep=" ", timespec="seconds"),
     }
 
 
@@ -60,7 +83,9 @@ def deserialize_game(game_data: Dict) -> Game:
     Rebuild a Game object from serialized JSON data.
 
     Expects the structure produced by serialize_game; resolves city references
-    by name when wiring markets and player location.
+    by name when wiring markets and player location. Fruit and city names are
+    interned, so the name strings used as price and inventory keys are the
+    same objects as the names on Fruit and City.
 
     Args:
         game_data: Dict from JSON file.
@@ -68,20 +93,29 @@ def deserialize_game(game_data: Dict) -> Game:
     Returns:
         Reconstructed Game object.
     """
-    fruits: List[Fruit] = [Fruit(**fruit) for fruit in game_data["fruits"]]
-    cities: List[City] = [City(**city) for city in game_data["cities"]]
+    intern = sys.intern
+    fruits: List[Fruit] = [
+        Fruit(**{**fruit, "name": intern(fruit["name"])}) for fruit in game_data["fruits"]
+    ]
+    cities: List[City] = [
+        City(**{**city, "name": intern(city["name"])}) for city in game_data["cities"]
+    ]
     city_lookup = {city.name: city for city in cities}
 
     markets = [
-        Market(city=city_lookup[market["city"]], prices=market["prices"])
+        Market(
+            city=city_lookup[market["city"]],
+            prices={intern(name): price for name, price in market["prices"].items()},
+        )
         for market in game_data["markets"]
     ]
 
-    player_city = city_lookup[game_data["player"]["current_city"]]
+    player_data = game_data["player"]
+    player_city = city_lookup[player_data["current_city"]]
     player = Player(
-        name=game_data["player"]["name"],
-        money=game_data["player"]["money"],
-        inventory=game_data["player"]["inventory"],
+        name=player_data["name"],
+        money=player_data["money"],
+        inventory={intern(name): qty for name, qty in player_data["inventory"].items()},
         current_city=player_city,
     )
 
@@ -98,21 +132,46 @@ def store_game(engine: GameEngine, path: Path | None = None) -> None:
     """
     Persist the current game state to disk.
 
+    The file is replaced atomically: the new save is fsynced to a temp file
+    and then renamed over the old one, so either the old save or the
+    complete new one is on disk. If writing fails, the temp file is removed
+    and the old save is left untouched. Paths ending in ".gz" are written
+    gzip-compressed.
+
     Args:
         engine: GameEngine with current game state.
         path: Optional custom save path. Defaults to GAME_FILE.
     """
     save_path = path or GAME_FILE
     game_data = serialize_game(engine)
-    with open(save_path, "w") as f:
-        json.dump(game_data, f)
-    logger.info(f"Game saved to '{save_path}'")
+    payload = json.dumps(game_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if save_path.suffix == ".gz":
+        # Level 1: most of the size win for negligible CPU
+        payload = gzip.compress(payload, compresslevel=1)
+    # Write to a sibling temp file and swap it in, so a crash mid-write
+    # never leaves a truncated save behind
+    tmp_path = save_path.with_name(save_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            # On disk before the rename, so a power loss can't leave the
+            # renamed save empty or truncated
+            os.fsync(f.fileno())
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    logger.info("Game saved to '{}'", save_path)
 
 
 def load_game(path: Path | None = None) -> GameEngine:
     """
     Load a saved game from disk and return a ready GameEngine.
 
+    Gzip-compressed saves are detected by their magic bytes, so plain and
+    compressed files load the same way regardless of file name.
+
     Args:
         path: Optional custom load path. Defaults to GAME_FILE.
 
@@ -122,11 +181,16 @@ def load_game(path: Path | None = None) -> GameEngine:
     Raises:
         FileNotFoundError: If save file does not exist.
         json.JSONDecodeError: If save file contains invalid JSON.
+        gzip.BadGzipFile: If a compressed save has a corrupt gzip header.
+        EOFError: If a compressed save is truncated.
+        zlib.error: If a compressed save's data stream is corrupt.
         KeyError: If save file is missing required keys.
     """
     load_path = path or GAME_FILE
-    with open(load_path, "r") as f:
-        game_data = json.load(f)
+    raw = load_path.read_bytes()
+    if raw.startswith(GZIP_MAGIC):
+        raw = gzip.decompress(raw)
+    game_data = json.loads(raw)
     game = deserialize_game(game_data)
     return GameEngine(game)
 
@@ -13,8 +13,8 @@ Usage:
     price = pricing.get_price(apple, tokyo)
 """
 
-from models import City, Fruit, Money, Game, Market
-from typing import Dict, List
+from models import City, Money, Game, Market
+from typing import Dict, List, Tuple
 import random
 
 
@@ -35,6 +35,18 @@ class PricingSystem:
             game: The Game object containing fruits, cities, and markets
         """
         self.game = game
+        # Fruits in display (alphabetical) order; prices dicts are written in
+        # this order so renderers can iterate them without sorting
+        self._fruits_by_name = sorted(game.fruits, key=lambda f: f.name)
+        # City name -> Market, so lookups are a dict get, not a scan. This is
+        # the only market index; GameEngine goes through get_market().
+        self._markets_by_city = {m.city.name: m for m in game.markets}
+        # Per market: (fruit name, base_price * city modifier) pairs in display
+        # order. Specialties are fixed for a game, so modifiers are looked up once.
+        self._base_rows = [
+            (market, self._modified_base_prices(market.city))
+            for market in game.markets
+        ]
         # Generate initial prices for all markets on game start
         self.regenerate_all_prices()
 
@@ -47,17 +59,34 @@ class PricingSystem:
             - A new day begins (triggered by GameEngine.advance_day())
         
         Each fruit in each city gets unique randomness applied.
+        Prices are stored in alphabetical fruit order.
         """
-        for market in self.game.markets:
-            # Calculate new prices for this market's city
-            new_prices = self._calculate_market_prices(
-                city=market.city,
-                fruits=self.game.fruits
-            )
+        for market, base_row in self._base_rows:
             # Update the market's prices directly
-            market.prices = new_prices
+            market.prices = self._calculate_market_prices(base_row)
 
-    def _calculate_market_prices(self, city: City, fruits: List[Fruit]) -> Dict[str, Money]:
+    def _modified_base_prices(self, city: City) -> List[Tuple[str, float]]:
+        """
+        Apply a city's specialty modifiers to every fruit's base price.
+        
+        This is a PRIVATE helper method (note the underscore prefix).
+        Called once per city from __init__.
+        
+        Args:
+            city: The city whose specialties to apply
+            
+        Returns:
+            List of (fruit name, base_price * city_modifier) in display order
+        """
+        # Values < 1.0 mean cheaper (city produces it)
+        # Values > 1.0 mean more expensive (city imports it)
+        # Default to 1.0 (neutral) if city doesn't specialize in a fruit
+        return [
+            (fruit.name, fruit.base_price * city.specialties.get(fruit.name, 1.0))
+            for fruit in self._fruits_by_name
+        ]
+
+    def _calculate_market_prices(self, base_row: List[Tuple[str, float]]) -> Dict[str, Money]:
         """
         Calculate prices for all fruits in a single city.
         
@@ -67,32 +96,29 @@ class PricingSystem:
         Price formula: base_price * city_modifier * random_factor
         
         Args:
-            city: The city to calculate prices for
-            fruits: List of all fruits in the game
+            base_row: The city's (fruit name, base_price * city_modifier) pairs
             
         Returns:
             Dict mapping fruit name to calculated price in cents
         """
-        prices: Dict[str, Money] = {}
+        # Bound per call (not at import) so tests can still patch random.uniform
+        uniform = random.uniform
+
+        # Each fruit gets its own random variance (±20%), truncated to int
+        # (Money is in cents, no fractional cents)
+        return {name: int(base * uniform(0.8, 1.2)) for name, base in base_row}
+
+    def get_market(self, city_name: str) -> Market | None:
+        """
+        Look up the market of a city by name.
         
-        for fruit in fruits:
-            # Get city's specialty modifier for this fruit
-            # Default to 1.0 (neutral) if city doesn't specialize in this fruit
-            # Values < 1.0 mean cheaper (city produces it)
-            # Values > 1.0 mean more expensive (city imports it)
-            city_modifier = city.specialties.get(fruit.name, 1.0)
-            
-            # Each fruit gets its own random variance (±20%)
-            # This creates daily market fluctuations
-            random_factor = random.uniform(0.8, 1.2)
-            
-            # Calculate final price
-            price = fruit.base_price * city_modifier * random_factor
+        Args:
+            city_name: Name of the city (e.g., "Pori")
             
-            # Convert to int (Money is in cents, no fractional cents)
-            prices[fruit.name] = int(price)
-        
-        return prices
+        Returns:
+            The city's Market, or None if the city has no market
+        """
+        return self._markets_by_city.get(city_name)
 
     def get_price(self, fruit_name: str, city_name: str) -> Money:
         """
@@ -109,11 +135,8 @@ class PricingSystem:
             This retrieves pre-calculated prices from Market objects.
             Prices are only recalculated when regenerate_all_prices() is called.
         """
-        # Find the market for this city
-        for market in self.game.markets:
-            if market.city.name == city_name:
-                # Return the fruit's price if it exists in this market
-                return market.prices.get(fruit_name, 0)
-        
-        # City not found - this shouldn't happen in normal gameplay
-        return 0
+        market = self._markets_by_city.get(city_name)
+        if market is None:
+            # City not found - this shouldn't happen in normal gameplay
+            return 0
+        return market.prices.get(fruit_name, 0)
@@ -5,6 +5,7 @@ from ui.rendering import (
     render_error,
     render_success,
     render_main_menu,
+    render_help_menu,
     render_game_view,
 )
 
@@ -13,6 +14,7 @@ __all__ = [
     "render_error",
     "render_success",
     "render_main_menu",
+    "render_help_menu",
     "render_game_view",
 ]
 
@@ -4,8 +4,13 @@ Rich-based UI rendering for Fruit Dealer Game.
 All display functions for menus, game views, and feedback messages.
 """
 
+from functools import lru_cache
+
 from rich.align import Align
-from rich.console import Console
+from rich.columns import Columns
+from rich.console import Console, Group
+from rich.markup import escape
+from rich.padding import Padding
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -13,8 +18,17 @@ from rich.text import Text
 from game_engine import GameEngine
 
 
-# Shared console instance
-console = Console()
+# Shared console instance. The repr highlighter is off: every cell here is
+# explicitly styled, and highlighting would regex-scan each printed string.
+console = Console(highlight=False)
+
+
+def _fmt_cents(cents: int) -> str:
+    """Format integer cents as dollars (e.g. 123456 -> "$1,234.56", -50 -> "-$0.50") without floats."""
+    # divmod floors toward negative infinity, so split the magnitude only
+    dollars, rest = divmod(abs(cents), 100)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}${dollars:,}.{rest:02d}"
 
 
 def render_error(msg: str, hint: str | None = None) -> None:
@@ -25,16 +39,15 @@ def render_error(msg: str, hint: str | None = None) -> None:
         msg: Main error message to display.
         hint: Optional hint text shown below the main message in dim style.
     """
-    content = Text(msg, style="yellow")
+    content = f"[yellow]{escape(msg)}[/yellow]"
     if hint:
-        content.append(f"\n{hint}", style="dim")
-    console.print()
-    console.print(Panel(
+        content += f"\n[dim]{escape(hint)}[/dim]"
+    console.print(Group(Text(), Panel(
         content,
         title="[bold yellow]Error[/bold yellow]",
         border_style="red",
         padding=(0, 2),
-    ))
+    )))
 
 
 def render_success(msg: str) -> None:
@@ -44,31 +57,15 @@ def render_success(msg: str) -> None:
     Args:
         msg: Success message to display.
     """
-    console.print()
-    console.print(Panel(
-        Text(msg, style="bold green"),
+    console.print(Group(Text(), Panel(
+        f"[bold green]{escape(msg)}[/bold green]",
         border_style="green",
         padding=(0, 2),
-    ))
-
+    )))
 
-def render_main_menu() -> None:
-    """
-    Render the primary CLI menu with Rich formatting.
-
-    Displays centered title/subtitle and a menu panel with three options:
-    start new game, load existing game, and exit.
-    """
-    console.print()
-    console.print()
-
-    title = Text("🍉 Fruit Dealer Game 🍊", style="bold magenta")
-    subtitle = Text("Trade smart. Travel far. Get rich.", style="dim italic")
-
-    console.print(Align.center(title))
-    console.print(Align.center(subtitle))
-    console.print()
 
+def _build_main_menu_panel() -> Panel:
+    """Build the static main menu panel (called once at import)."""
     table = Table.grid(padding=(0, 2))
     table.add_column(justify="right", style="bold cyan")
     table.add_column(style="white")
@@ -76,89 +73,156 @@ def render_main_menu() -> None:
     table.add_row("[2]", "Load a game")
     table.add_row("[3]", "Exit")
 
-    panel = Panel(
+    return Panel(
         Align.center(table),
         title="[bold green]Main Menu[/bold green]",
         border_style="green",
         padding=(1, 4),
     )
 
-    console.print(panel)
-    console.print()
 
+# The main menu never changes, so its renderables are built once and reused
+_MAIN_MENU_TITLE = Align.center(Text("🍉 Fruit Dealer Game 🍊", style="bold magenta"))
+_MAIN_MENU_SUBTITLE = Align.center(Text("Trade smart. Travel far. Get rich.", style="dim italic"))
+_MAIN_MENU_PANEL = _build_main_menu_panel()
 
-def render_game_view(engine: GameEngine) -> None:
-    """
-    Render game overview with player stats and market prices in horizontal layout.
+# Whole menu screen, blank lines included, printed in a single call
+_MAIN_MENU = Group(
+    Text(),
+    Text(),
+    _MAIN_MENU_TITLE,
+    _MAIN_MENU_SUBTITLE,
+    Text(),
+    _MAIN_MENU_PANEL,
+    Text(),
+)
 
-    Displays:
-        - Player stats panel (left): money, inventory, location, and day
-        - Market prices panel (right): current city's fruit prices
 
-    Args:
-        engine: GameEngine containing current game state.
+def render_main_menu() -> None:
     """
-    player = engine.player
-    game = engine.game
-    market = next((m for m in game.markets if m.city.name == player.current_city.name), None)
+    Render the primary CLI menu with Rich formatting.
+
+    Displays centered title/subtitle and a menu panel with three options:
+    start new game, load existing game, and exit.
+    """
+    console.print(_MAIN_MENU)
+
+
+def _build_help_panel() -> Panel:
+    """Build the static in-game command list panel (called once at import)."""
+    table = Table.grid(padding=(0, 2))
+    table.add_column(style="bold cyan")
+    table.add_column(style="white")
+    table.add_row("buy <fruit> <qty>", "Buy fruit at the current market")
+    table.add_row("sell <fruit> <qty>", "Sell fruit from your inventory")
+    table.add_row("travel <city>", "Travel to another city")
+    table.add_row("status", "Show your stats and market prices")
+    table.add_row("save", "Save the game")
+    table.add_row("quit / exit", "Return to the main menu")
+    table.add_row("help", "Show this list")
+
+    return Panel(
+        table,
+        title="[bold cyan]Commands[/bold cyan]",
+        border_style="cyan",
+        padding=(0, 2),
+    )
+
+
+# The command list never changes either
+_HELP_MENU = Group(Text(), _build_help_panel())
 
-    player_dollars = player.money / 100
-    dollars_formatted = f"${player_dollars:,.2f}"
 
-    # Player stats table with location/day in footer
+def render_help_menu() -> None:
+    """Render the list of in-game commands with their arguments."""
+    console.print(_HELP_MENU)
+
+
+@lru_cache(maxsize=8)
+def _build_stats_panel(
+    name: str,
+    money: int,
+    inventory: tuple[tuple[str, int], ...],
+    city_name: str,
+    day: int,
+) -> Panel:
+    """Build the player stats panel: money, inventory, location and day."""
     stats = Table.grid(padding=1)
     stats.add_column(style="cyan", justify="right", width=12)
     stats.add_column(style="white")
-    stats.add_row("Money", dollars_formatted)
-    stats.add_row("Inventory", ", ".join(f"{k} x{v}" for k, v in player.inventory.items()) or "empty")
-    
+    stats.add_row("Money", _fmt_cents(money))
+    stats.add_row("Inventory", ", ".join([f"{escape(k)} x{v}" for k, v in inventory]) or "empty")
+
     # Footer with location and day
     stats.add_row("", "")
     stats.add_row(
-        Text("📍 Location", style="dim"),
-        Text(f"{player.current_city.name}", style="bold cyan"),
+        "[dim]📍 Location[/dim]",
+        f"[bold cyan]{escape(city_name)}[/bold cyan]",
     )
     stats.add_row(
-        Text("📅 Day", style="dim"),
-        Text(f"{game.current_day}", style="bold cyan"),
+        "[dim]📅 Day[/dim]",
+        f"[bold cyan]{day}[/bold cyan]",
     )
 
-    stats_panel = Panel(
+    return Panel(
         stats,
-        title=f"[bold cyan]{player.name}[/bold cyan]",
+        title=f"[bold cyan]{escape(name)}[/bold cyan]",
         border_style="cyan",
         padding=(1, 2),
     )
 
-    # Prices table
+
+@lru_cache(maxsize=8)
+def _build_prices_panel(prices: tuple[tuple[str, int], ...] | None) -> Panel:
+    """Build the market prices panel; prices is None when there is no market."""
     prices_table = Table(show_header=True, header_style="bold green")
     prices_table.add_column("Fruit", style="magenta", width=12)
     prices_table.add_column("Price ($)", justify="right", style="white")
 
-    if market:
-        for fruit_name, price in sorted(market.prices.items()):
-            prices_table.add_row(fruit_name, f"${price / 100:,.2f}")
+    if prices is not None:
+        # PricingSystem writes prices in alphabetical order
+        for fruit_name, price in prices:
+            prices_table.add_row(escape(fruit_name), _fmt_cents(price))
     else:
         prices_table.add_row("No market", "-")
 
-    prices_panel = Panel(
+    return Panel(
         prices_table,
         title="[bold green]Market Prices[/bold green]",
         border_style="green",
         padding=(1, 2),
     )
 
-    # Horizontal layout with spacing
-    console.print()
-    layout_table = Table.grid(padding=0, pad_edge=False)
-    layout_table.add_column(ratio=1, min_width=6)
-    layout_table.add_column(ratio=0)
-    layout_table.add_column(ratio=2, min_width=10)
-    layout_table.add_column(ratio=0)
-    layout_table.add_column(ratio=1, min_width=6)
-    
-    layout_table.add_row("", stats_panel, "", prices_panel, "")
-    
-    console.print(layout_table)
-    console.print()
+
+def render_game_view(engine: GameEngine) -> None:
+    """
+    Render game overview with player stats and market prices in horizontal layout.
+
+    Displays:
+        - Player stats panel (left): money, inventory, location, and day
+        - Market prices panel (right): current city's fruit prices
+
+    Args:
+        engine: GameEngine containing current game state.
+    """
+    player = engine.player
+    market = engine.current_market
+
+    # Panels are memoized on the displayed values, so redraws of an
+    # unchanged state reuse the same renderables
+    stats_panel = _build_stats_panel(
+        player.name,
+        player.money,
+        tuple(player.inventory.items()),
+        player.current_city.name,
+        engine.game.current_day,
+    )
+    prices_panel = _build_prices_panel(
+        tuple(market.prices.items()) if market else None
+    )
+
+    # Panels side by side, indented from the left edge
+    layout = Padding(Columns([stats_panel, prices_panel], padding=(0, 6)), (0, 6))
+
+    console.print(Group(Text(), layout, Text()))
 
@@ -1,20 +1,23 @@
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
-from typing import Callable
+from typing import Deque, Dict, List
+from typing import Callable, Iterator
 import pytest
 
 from game_engine import GameEngine  
+from game_setup import setup_data
 from models import Fruit, City, Market, Game, Money, Coordinates, Emoji, Player
 from persistence import GAME_FILE
+from ui.rendering import console
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_fruit() -> Callable[[str, Money, str], Fruit]:
     def _make_fruit(name: str, base_price: Money, emoji: Emoji, description: str) -> Fruit:
         return Fruit(name=name, base_price=base_price, emoji=emoji, description=description)
     return _make_fruit
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_city() -> Callable[[str, Coordinates, Dict[str, float]], City]:
     def _make_city(
         name: str,
@@ -29,14 +32,14 @@ def make_city() -> Callable[[str, Coordinates, Dict[str, float]], City]:
         )
     return _make_city
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_market() -> Callable[[City, Dict[str, Money]], Market]:
     def _make_market(city: City, prices: Dict[str, Money] = None) -> Market:
         return Market(city=city, prices=prices if prices else {})
     return _make_market
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_player() -> Callable[[str, Money, Dict[str, int], City | None], Player]:
     def _make_player(
         name: str,
@@ -52,7 +55,7 @@ def make_player() -> Callable[[str, Money, Dict[str, int], City | None], Player]
         )
     return _make_player
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_game(make_market, make_player) -> Callable[[List[Fruit], List[City], dict], Game]:
     def _make_game(
         fruits: List[Fruit],
@@ -98,17 +101,54 @@ def helsinki() -> City:
     return City(name="Helsinki", position=(0, 0), specialties={"Apple": 1.2})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_name() -> str:
     return "Test Player"
 
+@pytest.fixture(scope="session")
+def make_default_game() -> Callable[[str], Game]:
+    """Default game factory for tests that stub out start_new_game or load_game."""
+    return setup_data
+
 @pytest.fixture
-def game_engine(make_game, apple, banana, pori) -> GameEngine:
+def game_engine(make_game, apple, banana, pori, helsinki) -> GameEngine:
     game = make_game(
         fruits=[apple, banana],
-        cities=[pori],
+        cities=[pori, helsinki],
         player_money=1_000,
         player_city=pori,
         player_inventory={},
     )
     return GameEngine(game)
+
+
+@pytest.fixture
+def rich_capture() -> Iterator[Callable[[], str]]:
+    """Capture the shared Rich console in memory instead of through capsys.
+
+    Yields a function that returns everything printed so far.
+    """
+    chunks: List[str] = []
+
+    def _read() -> str:
+        chunks.append(console.end_capture())
+        console.begin_capture()
+        return "".join(chunks)
+
+    console.begin_capture()
+    try:
+        yield _read
+    finally:
+        console.end_capture()
+
+
+@pytest.fixture
+def prompt_queue(monkeypatch) -> Deque[str]:
+    """Answers for rich's Prompt.ask, consumed in order.
+
+    Patches the Prompt class itself, so every module that imported it
+    reads from the same queue.
+    """
+    answers: Deque[str] = deque()
+    monkeypatch.setattr("rich.prompt.Prompt.ask", lambda *args, **kwargs: answers.popleft())
+    return answers
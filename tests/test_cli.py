@@ -3,226 +3,174 @@ Tests for cli module.
 
 Tests command-line interface, menu handling, validation, and error handling.
 """
+import gzip
+
 import pytest
 
 from cli import cli
-from game_setup import setup_data
 from game_engine import GameEngine
+from persistence import load_game
 
 
-def test_cli_starts_new_game_branch(monkeypatch, capsys, tmp_path):
-    """Test that CLI command 1 starts a new game."""
-    monkeypatch.setattr("persistence.GAME_FILE", tmp_path / "game.json")
-    monkeypatch.setattr("cli.GAME_FILE", tmp_path / "game.json")
-    # Stub start_new_game to avoid internal Prompt.ask for player name
-    monkeypatch.setattr("cli.start_new_game", lambda: GameEngine(setup_data("Eve")))
-    # Stub game_loop to avoid heavy Rich output
+@pytest.fixture(autouse=True)
+def _stub_cli(monkeypatch, make_default_game):
+    """Stub out new game, loading and the game loop for every CLI test.
+
+    Tests that need the real behaviour override the single attribute.
+    """
+    monkeypatch.setattr("cli.start_new_game", lambda: GameEngine(make_default_game("Test")))
+    monkeypatch.setattr("cli.load_game", lambda: GameEngine(make_default_game("Loaded")))
     monkeypatch.setattr("cli.game_loop", lambda engine: None)
-    call_count = {"count": 0}
 
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "1"
-        else:
-            return "3"  # Exit after first command
 
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
+def test_cli_starts_new_game_branch(monkeypatch, rich_capture, tmp_path):
+    """Test that CLI command 1 starts a new game."""
+    monkeypatch.setattr("persistence.GAME_FILE", tmp_path / "game.json")
+    answers = iter(["1", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
 
     cli()
-    captured = capsys.readouterr()
+    output = rich_capture()
     assert tmp_path.joinpath("game.json").exists()
 
 
-def test_cli_handles_invalid_command(monkeypatch, capsys):
+def test_cli_handles_invalid_command(monkeypatch, rich_capture):
     """Test that invalid menu commands show error and retry."""
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        # First two calls return invalid, then exit
-        if call_count["count"] <= 2:
-            return "invalid"  # Invalid (not an integer)
-        else:
-            return "3"  # Valid (exit)
-
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
-    # Stub to avoid unintended prompts
-    monkeypatch.setattr("cli.start_new_game", lambda: GameEngine(setup_data("Test")))
-    monkeypatch.setattr("cli.load_game", lambda: GameEngine(setup_data("Test")))
-    monkeypatch.setattr("cli.game_loop", lambda engine: None)
+    answers = iter(["invalid", "invalid", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
 
     cli()
-    captured = capsys.readouterr()
+    output = rich_capture()
     # Should show error for invalid input
-    assert "Invalid choice" in captured.out or "Error" in captured.out
+    assert "Invalid choice" in output or "Error" in output
     # Should eventually exit
-    assert "Thanks for playing" in captured.out
+    assert "Thanks for playing" in output
 
 
-def test_cli_load_branch(tmp_path, monkeypatch, capsys):
+def test_cli_load_branch(tmp_path, monkeypatch, rich_capture):
     """Test that CLI command 2 loads a game."""
-    # Stub load_game to avoid file I/O and internal prompts
-    monkeypatch.setattr("cli.load_game", lambda: GameEngine(setup_data("Loaded")))
-    monkeypatch.setattr("cli.game_loop", lambda engine: None)
-
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "2"
-        else:
-            return "3"  # Exit after load
-
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
+    answers = iter(["2", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
 
     cli()
-    captured = capsys.readouterr()
-    assert "Game loaded successfully" in captured.out or "Loaded" in captured.out
+    output = rich_capture()
+    assert "Game loaded successfully" in output or "Loaded" in output
 
 
-def test_cli_exit_branch(monkeypatch, capsys):
+def test_cli_exit_branch(monkeypatch, rich_capture):
     """Test that command 3 exits the CLI loop."""
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        return "3"  # Exit
-
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
+    answers = iter(["3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
     
     # cli() uses break, not exit(), so it returns normally
     cli()
-    captured = capsys.readouterr()
-    assert "Thanks for playing" in captured.out
+    output = rich_capture()
+    assert "Thanks for playing" in output
 
 
-def test_cli_validates_menu_command_integer(monkeypatch, capsys):
+def test_cli_validates_menu_command_integer(monkeypatch, rich_capture):
     """Test that menu command must be an integer."""
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        # Return invalid inputs, then exit
-        if call_count["count"] == 1:
-            return "abc"  # Invalid (not integer)
-        elif call_count["count"] == 2:
-            return "5"  # Invalid (out of range)
-        else:
-            return "3"  # Valid (exit)
-
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
-    monkeypatch.setattr("cli.start_new_game", lambda: GameEngine(setup_data("Test")))
-    monkeypatch.setattr("cli.load_game", lambda: GameEngine(setup_data("Test")))
-    monkeypatch.setattr("cli.game_loop", lambda engine: None)
+    answers = iter(["abc", "5", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
 
     cli()
-    captured = capsys.readouterr()
+    output = rich_capture()
     # Should show error messages for invalid inputs
-    assert "Invalid choice" in captured.out or "Error" in captured.out
+    assert "Invalid choice" in output or "Error" in output
     # Should eventually exit
-    assert "Thanks for playing" in captured.out
+    assert "Thanks for playing" in output
 
 
-def test_cli_validates_menu_command_range(monkeypatch, capsys):
+def test_cli_validates_menu_command_range(monkeypatch, rich_capture):
     """Test that menu command must be 1, 2, or 3."""
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        # Return invalid inputs, then exit
-        if call_count["count"] == 1:
-            return "0"  # Invalid (below range)
-        elif call_count["count"] == 2:
-            return "4"  # Invalid (above range)
-        else:
-            return "3"  # Valid (exit)
-
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
-    monkeypatch.setattr("cli.start_new_game", lambda: GameEngine(setup_data("Test")))
-    monkeypatch.setattr("cli.load_game", lambda: GameEngine(setup_data("Test")))
-    monkeypatch.setattr("cli.game_loop", lambda engine: None)
+    answers = iter(["0", "4", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
 
     cli()
-    captured = capsys.readouterr()
+    output = rich_capture()
     # Should show errors for invalid inputs
-    assert "Invalid choice" in captured.out or "Error" in captured.out
+    assert "Invalid choice" in output or "Error" in output
     # Should eventually exit
-    assert "Thanks for playing" in captured.out
+    assert "Thanks for playing" in output
 
 
-def test_load_game_file_not_found_error(tmp_path, monkeypatch, capsys):
+def test_load_game_file_not_found_error(tmp_path, monkeypatch, rich_capture):
     """Test that FileNotFoundError is handled gracefully when loading."""
     monkeypatch.setattr("persistence.GAME_FILE", tmp_path / "nonexistent.json")
-    monkeypatch.setattr("cli.GAME_FILE", tmp_path / "nonexistent.json")
+    monkeypatch.setattr("cli.load_game", load_game)
 
     # Simulate menu command 2 (load)
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "2"
-        else:
-            return "3"  # Exit after error
-
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
+    answers = iter(["2", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
     exit_called = {"called": False}
     monkeypatch.setattr("builtins.exit", lambda: exit_called.update({"called": True}))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
 
     cli()
-    captured = capsys.readouterr()
-    assert "No save file found" in captured.out or "Error" in captured.out
+    output = rich_capture()
+    assert "No save file found" in output or "Error" in output
 
 
-def test_load_game_json_decode_error(tmp_path, monkeypatch, capsys):
+def test_load_game_json_decode_error(tmp_path, monkeypatch, rich_capture):
     """Test that JSONDecodeError is handled when file is corrupted."""
     game_file = tmp_path / "game.json"
     game_file.write_text("{invalid json}", encoding="utf-8")
     monkeypatch.setattr("persistence.GAME_FILE", game_file)
-    monkeypatch.setattr("cli.GAME_FILE", game_file)
-
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "2"
-        else:
-            return "3"
+    monkeypatch.setattr("cli.load_game", load_game)
 
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
+    answers = iter(["2", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
     exit_called = {"called": False}
     monkeypatch.setattr("builtins.exit", lambda: exit_called.update({"called": True}))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
+
+    cli()
+    output = rich_capture()
+    assert "corrupted" in output or "Error" in output
+
+
+_GZIP_SAVE = gzip.compress(b'{"fruits": []}' * 20)
+
+
+@pytest.mark.parametrize("raw", [
+    _GZIP_SAVE[:len(_GZIP_SAVE) // 2],  # Truncated stream: EOFError
+    b"\x1f\x8b\x00garbage",  # Bad header: gzip.BadGzipFile
+    _GZIP_SAVE[:10] + b"\xff" * 20 + _GZIP_SAVE[-8:],  # Corrupt data: zlib.error
+])
+def test_load_game_corrupt_gzip_save(raw, tmp_path, monkeypatch, rich_capture):
+    """Test that a corrupt compressed save is reported like any corrupted save."""
+    game_file = tmp_path / "game.json.gz"
+    game_file.write_bytes(raw)
+    monkeypatch.setattr("persistence.GAME_FILE", game_file)
+    monkeypatch.setattr("cli.load_game", load_game)
+
+    answers = iter(["2", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
 
     cli()
-    captured = capsys.readouterr()
-    assert "corrupted" in captured.out or "Error" in captured.out
+    output = rich_capture()
+    assert "corrupted" in output
 
 
-def test_load_game_key_error_incompatible_save(tmp_path, monkeypatch, capsys):
+def test_load_game_key_error_incompatible_save(tmp_path, monkeypatch, rich_capture):
     """Test that KeyError is handled when save file is incompatible."""
     game_file = tmp_path / "game.json"
     # Write incomplete JSON (missing required keys)
     game_file.write_text('{"player": {"name": "Test"}}', encoding="utf-8")
     monkeypatch.setattr("persistence.GAME_FILE", game_file)
-    monkeypatch.setattr("cli.GAME_FILE", game_file)
-
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "2"
-        else:
-            return "3"
+    monkeypatch.setattr("cli.load_game", load_game)
 
-    monkeypatch.setattr("cli.Prompt.ask", mock_prompt)
+    answers = iter(["2", "3"])
+    monkeypatch.setattr("cli.console.input", lambda prompt: next(answers))
     exit_called = {"called": False}
     monkeypatch.setattr("builtins.exit", lambda: exit_called.update({"called": True}))
+    monkeypatch.setattr("cli.render_main_menu", lambda: None)  # Only errors are checked
 
     cli()
-    captured = capsys.readouterr()
-    assert "incompatible" in captured.out or "Error" in captured.out or "Missing key" in captured.out
+    output = rich_capture()
+    assert "incompatible" in output or "Error" in output or "Missing key" in output
 
@@ -2,52 +2,36 @@
 Tests for commands module.
 
 Tests command parsing, execution, and game loop functionality.
-
-25 tests.
 """
 
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
-from commands import pluralize, parse_command, execute_command, game_loop, COMMANDS
+from commands import parse_command, execute_command, game_loop
 from game_engine import GameEngine
 from models import Game, Fruit, City, Player, Market
 from conftest import make_game, apple, banana, pori, helsinki
 
 
-# --- Test pluralize ---
-
-def test_pluralize_singular():
-    """Test that singular count returns singular form."""
-    assert pluralize("apple", 1) == "apple"
-    assert pluralize("orange", 1) == "orange"
-    assert pluralize("banana", 1) == "banana"
-
-
-def test_pluralize_plural():
-    """Test that plural count returns plural form."""
-    assert pluralize("apple", 2) == "apples"
-    assert pluralize("orange", 0) == "oranges"
-    assert pluralize("banana", 10) == "bananas"
+@pytest.fixture(autouse=True)
+def ui_calls(monkeypatch):
+    """Replace the UI hooks used by commands with recorders for every test.
 
-
-def test_pluralize_edge_cases():
-    """Test edge cases for pluralize."""
-    assert pluralize("", 1) == ""
-    assert pluralize("", 2) == "s"
-    assert pluralize("test", -1) == "tests"  # Negative counts still pluralize
+    Records error (msg, hint) pairs, success messages, rendered views and help calls.
+    """
+    recorder = SimpleNamespace(error=[], success=[], views=[], help=[])
+    monkeypatch.setattr("commands.render_error", lambda msg, hint=None: recorder.error.append((msg, hint)))
+    monkeypatch.setattr("commands.render_success", recorder.success.append)
+    monkeypatch.setattr("commands.render_game_view", recorder.views.append)
+    monkeypatch.setattr("commands.render_help_menu", lambda: recorder.help.append(True))
+    return recorder
 
 
 # --- Test parse_command ---
 
-def test_parse_command_valid_commands(monkeypatch):
+def test_parse_command_valid_commands(ui_calls):
     """Test parsing valid commands."""
-    calls = []
-    def mock_render_error(msg, hint=None):
-        calls.append((msg, hint))
-    
-    monkeypatch.setattr("commands.render_error", mock_render_error)
-    
     # Commands without args
     assert parse_command("help") == ("help", [])
     assert parse_command("status") == ("status", [])
@@ -68,102 +52,73 @@ def test_parse_command_valid_commands(monkeypatch):
     assert parse_command("Buy Apple 5") == ("buy", ["Apple", "5"])
     
     # No error calls for valid commands
-    assert len(calls) == 0
+    assert len(ui_calls.error) == 0
 
 
-def test_parse_command_edge_cases(monkeypatch):
+def test_parse_command_edge_cases(ui_calls):
     """Test edge cases for parse_command."""
-    calls = []
-    def mock_render_error(msg, hint=None):
-        calls.append((msg, hint))
-    
-    monkeypatch.setattr("commands.render_error", mock_render_error)
-    
     # Empty strings
     assert parse_command("") is None
     assert parse_command("   ") is None  # Only whitespace
     
     # Invalid commands
     assert parse_command("invalid") is None
-    assert len(calls) == 1
-    assert "Invalid command" in calls[0][0]
+    assert len(ui_calls.error) == 1
+    assert "Invalid command" in ui_calls.error[0][0]
     
-    calls.clear()
+    ui_calls.error.clear()
     assert parse_command("lease apple 5") is None
-    assert len(calls) == 1
+    assert len(ui_calls.error) == 1
 
 
-def test_parse_command_whitespace_handling(monkeypatch):
+def test_parse_command_whitespace_handling():
     """Test that whitespace is handled correctly."""
-    monkeypatch.setattr("commands.render_error", lambda *args, **kwargs: None)
-    
     assert parse_command("  help  ") == ("help", [])
     assert parse_command("buy  apple  5") == ("buy", ["apple", "5"])
 
 
 # --- Test execute_command ---
 
-@pytest.fixture
-def mock_ui(monkeypatch):
-    """Fixture to mock UI rendering functions."""
-    error_calls = []
-    success_calls = []
-    
-    def mock_render_error(msg, hint=None):
-        error_calls.append((msg, hint))
-    
-    def mock_render_success(msg):
-        success_calls.append((msg,))
-    
-    def mock_render_game_view(engine):
-        pass  # No-op for tests
-    
-    monkeypatch.setattr("commands.render_error", mock_render_error)
-    monkeypatch.setattr("commands.render_success", mock_render_success)
-    monkeypatch.setattr("commands.render_game_view", mock_render_game_view)
-    
-    return {"error": error_calls, "success": success_calls}
-
-
-def test_execute_command_help(mock_ui, make_game, apple, pori):
+def test_execute_command_help(ui_calls, make_game, apple, pori):
     """Test help command."""
     engine = GameEngine(make_game(fruits=[apple], cities=[pori]))
-    result = execute_command(engine, "help", [])
+    result, _ = execute_command(engine, "help", [])
     assert result is True
+    assert len(ui_calls.help) == 1
 
 
-def test_execute_command_status(mock_ui, make_game, apple, pori):
+def test_execute_command_status(ui_calls, make_game, apple, pori):
     """Test status command."""
     engine = GameEngine(make_game(fruits=[apple], cities=[pori]))
-    result = execute_command(engine, "status", [])
+    result, _ = execute_command(engine, "status", [])
     assert result is True
 
 
-def test_execute_command_save(mock_ui, tmp_path, monkeypatch, make_game, apple, pori):
+def test_execute_command_save(ui_calls, tmp_path, monkeypatch, make_game, apple, pori):
     """Test save command."""
     save_path = tmp_path / "test_save.json"
     monkeypatch.setattr("persistence.GAME_FILE", save_path)
     monkeypatch.setattr("commands.store_game", lambda engine, path=None: None)
     
     engine = GameEngine(make_game(fruits=[apple], cities=[pori]))
-    result = execute_command(engine, "save", [])
+    result, _ = execute_command(engine, "save", [])
     assert result is True
-    assert len(mock_ui["success"]) == 1
-    assert "saved" in mock_ui["success"][0][0].lower()
+    assert len(ui_calls.success) == 1
+    assert "saved" in ui_calls.success[0].lower()
 
 
-def test_execute_command_quit_exit(mock_ui, make_game, apple, pori):
+def test_execute_command_quit_exit(ui_calls, make_game, apple, pori):
     """Test quit and exit commands."""
     engine = GameEngine(make_game(fruits=[apple], cities=[pori]))
     
-    result = execute_command(engine, "quit", [])
+    result, _ = execute_command(engine, "quit", [])
     assert result is False
     
-    result = execute_command(engine, "exit", [])
+    result, _ = execute_command(engine, "exit", [])
     assert result is False
 
 
-def test_execute_command_buy_success(mock_ui, monkeypatch, make_game, apple, pori):
+def test_execute_command_buy_success(ui_calls, monkeypatch, make_game, apple, pori):
     """Test successful buy command."""
     game = make_game(fruits=[apple], cities=[pori], player_money=10000)
     engine = GameEngine(game)
@@ -172,45 +127,56 @@ def test_execute_command_buy_success(mock_ui, monkeypatch, make_game, apple, por
     original_get_price = engine.pricing.get_price
     engine.pricing.get_price = lambda fruit, city: 100
     
-    result = execute_command(engine, "buy", ["apple", "5"])
+    result, _ = execute_command(engine, "buy", ["apple", "5"])
     assert result is True
-    assert len(mock_ui["success"]) == 1
-    assert "Bought" in mock_ui["success"][0][0]
+    assert len(ui_calls.success) == 1
+    assert "Bought" in ui_calls.success[0]
     assert engine.player.inventory.get("Apple", 0) == 5
 
 
-def test_execute_command_buy_invalid_args(mock_ui, make_game, apple, pori):
+def test_execute_command_buy_invalid_args(ui_calls, make_game, apple, pori):
     """Test buy command with invalid arguments."""
     engine = GameEngine(make_game(fruits=[apple], cities=[pori]))
     
     # Missing args
-    result = execute_command(engine, "buy", ["apple"])
+    result, _ = execute_command(engine, "buy", ["apple"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
-    assert "Usage" in mock_ui["error"][0][0]
+    assert len(ui_calls.error) >= 1
+    assert "Usage" in ui_calls.error[0][0]
     
-    mock_ui["error"].clear()
+    ui_calls.error.clear()
     
     # Invalid quantity
-    result = execute_command(engine, "buy", ["apple", "abc"])
+    result, _ = execute_command(engine, "buy", ["apple", "abc"])
+    assert result is True
+    assert len(ui_calls.error) >= 1
+    assert "number" in ui_calls.error[0][0].lower()
+
+
+@pytest.mark.parametrize("command", ["buy", "sell"])
+def test_execute_command_rejects_superscript_quantity(command, ui_calls, make_game, apple, pori):
+    """Test that digits int() cannot parse, like '²', get an error panel."""
+    game = make_game(fruits=[apple], cities=[pori], player_inventory={"Apple": 1})
+    engine = GameEngine(game)
+
+    result, _ = execute_command(engine, command, ["apple", "²"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
-    assert "number" in mock_ui["error"][0][0].lower()
+    assert "number" in ui_calls.error[0][0].lower()
 
 
-def test_execute_command_buy_game_error(mock_ui, monkeypatch, make_game, apple, pori):
+def test_execute_command_buy_game_error(ui_calls, monkeypatch, make_game, apple, pori):
     """Test buy command when game engine raises error."""
     game = make_game(fruits=[apple], cities=[pori], player_money=10)
     engine = GameEngine(game)
     
     # Price is higher than available money
-    result = execute_command(engine, "buy", ["apple", "1"])
+    result, _ = execute_command(engine, "buy", ["apple", "1"])
     assert result is True
     # Should have error from game engine
-    assert len(mock_ui["error"]) >= 1
+    assert len(ui_calls.error) >= 1
 
 
-def test_execute_command_sell_success(mock_ui, make_game, apple, pori):
+def test_execute_command_sell_success(ui_calls, make_game, apple, pori):
     """Test successful sell command."""
     game = make_game(
         fruits=[apple], 
@@ -223,46 +189,46 @@ def test_execute_command_sell_success(mock_ui, make_game, apple, pori):
     initial_money = engine.player.money
     initial_inventory = engine.player.inventory["Apple"]
     
-    result = execute_command(engine, "sell", ["apple", "2"])
+    result, _ = execute_command(engine, "sell", ["apple", "2"])
     assert result is True
-    assert len(mock_ui["success"]) == 1
-    assert "Sold" in mock_ui["success"][0][0]
+    assert len(ui_calls.success) == 1
+    assert "Sold" in ui_calls.success[0]
     assert engine.player.inventory["Apple"] == initial_inventory - 2
     assert engine.player.money > initial_money
 
 
-def test_execute_command_sell_invalid_args(mock_ui, make_game, apple, pori):
+def test_execute_command_sell_invalid_args(ui_calls, make_game, apple, pori):
     """Test sell command with invalid arguments."""
     game = make_game(fruits=[apple], cities=[pori], player_inventory={"Apple": 1})
     engine = GameEngine(game)
     
     # Missing args
-    result = execute_command(engine, "sell", ["apple"])
+    result, _ = execute_command(engine, "sell", ["apple"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
-    assert "Usage" in mock_ui["error"][0][0]
+    assert len(ui_calls.error) >= 1
+    assert "Usage" in ui_calls.error[0][0]
     
-    mock_ui["error"].clear()
+    ui_calls.error.clear()
     
     # Invalid quantity
-    result = execute_command(engine, "sell", ["apple", "xyz"])
+    result, _ = execute_command(engine, "sell", ["apple", "xyz"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
-    assert "number" in mock_ui["error"][0][0].lower()
+    assert len(ui_calls.error) >= 1
+    assert "number" in ui_calls.error[0][0].lower()
 
 
-def test_execute_command_sell_game_error(mock_ui, make_game, apple, pori):
+def test_execute_command_sell_game_error(ui_calls, make_game, apple, pori):
     """Test sell command when game engine raises error."""
     game = make_game(fruits=[apple], cities=[pori], player_inventory={"Apple": 1})
     engine = GameEngine(game)
     
     # Try to sell more than available
-    result = execute_command(engine, "sell", ["apple", "10"])
+    result, _ = execute_command(engine, "sell", ["apple", "10"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
+    assert len(ui_calls.error) >= 1
 
 
-def test_execute_command_travel_success(mock_ui, make_game, apple, pori, helsinki):
+def test_execute_command_travel_success(ui_calls, make_game, apple, pori, helsinki):
     """Test successful travel command."""
     game = make_game(
         fruits=[apple], 
@@ -273,34 +239,34 @@ def test_execute_command_travel_success(mock_ui, make_game, apple, pori, helsink
     engine = GameEngine(game)
     
     initial_city = engine.player.current_city.name
-    result = execute_command(engine, "travel", ["helsinki"])
+    result, _ = execute_command(engine, "travel", ["helsinki"])
     assert result is True
-    assert len(mock_ui["success"]) == 1
-    assert "Traveled" in mock_ui["success"][0][0]
+    assert len(ui_calls.success) == 1
+    assert "Traveled" in ui_calls.success[0]
     assert engine.player.current_city.name == "Helsinki"
     assert engine.player.current_city.name != initial_city
 
 
-def test_execute_command_travel_invalid_args(mock_ui, make_game, apple, pori, helsinki):
+def test_execute_command_travel_invalid_args(ui_calls, make_game, apple, pori, helsinki):
     """Test travel command with invalid arguments."""
     game = make_game(fruits=[apple], cities=[pori, helsinki])
     engine = GameEngine(game)
     
     # Missing args
-    result = execute_command(engine, "travel", [])
+    result, _ = execute_command(engine, "travel", [])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
-    assert "Usage" in mock_ui["error"][0][0]
+    assert len(ui_calls.error) >= 1
+    assert "Usage" in ui_calls.error[0][0]
     
-    mock_ui["error"].clear()
+    ui_calls.error.clear()
     
     # Too many args
-    result = execute_command(engine, "travel", ["helsinki", "extra"])
+    result, _ = execute_command(engine, "travel", ["helsinki", "extra"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
+    assert len(ui_calls.error) >= 1
 
 
-def test_execute_command_travel_game_error(mock_ui, make_game, apple, pori, helsinki):
+def test_execute_command_travel_game_error(ui_calls, make_game, apple, pori, helsinki):
     """Test travel command when game engine raises error."""
     game = make_game(
         fruits=[apple], 
@@ -310,21 +276,48 @@ def test_execute_command_travel_game_error(mock_ui, make_game, apple, pori, hels
     )
     engine = GameEngine(game)
     
-    result = execute_command(engine, "travel", ["InvalidCity"])
+    result, _ = execute_command(engine, "travel", ["InvalidCity"])
+    assert result is True
+    assert len(ui_calls.error) >= 1
+
+
+def test_execute_command_unknown_fruit(ui_calls, make_game, apple, pori):
+    """Test that buy/sell reject fruits that are not in the game."""
+    engine = GameEngine(make_game(fruits=[apple], cities=[pori], player_money=10000))
+
+    result, _ = execute_command(engine, "buy", ["kiwi", "1"])
     assert result is True
-    assert len(mock_ui["error"]) >= 1
+    assert "Unknown fruit" in ui_calls.error[0][0]
+    assert engine.player.inventory == {}
+
+
+def test_execute_command_names_are_case_insensitive(ui_calls, make_game, apple, pori, helsinki):
+    """Test that fruit and city names resolve regardless of case."""
+    game = make_game(fruits=[apple], cities=[pori, helsinki], player_money=10000)
+    engine = GameEngine(game)
+
+    execute_command(engine, "buy", ["APPLE", "2"])
+    assert engine.player.inventory["Apple"] == 2
+    assert "Bought 2 Apples!" in ui_calls.success[-1]
+
+    execute_command(engine, "sell", ["aPpLe", "1"])
+    assert "Sold 1 Apple!" in ui_calls.success[-1]
+
+    execute_command(engine, "travel", ["hElSiNkI"])
+    assert engine.player.current_city.name == "Helsinki"
+    assert "Traveled to Helsinki" in ui_calls.success[-1]
 
 
-def test_execute_command_unknown_command(mock_ui, make_game, apple, pori):
+def test_execute_command_unknown_command(ui_calls, make_game, apple, pori):
     """Test that unknown commands continue the loop."""
     engine = GameEngine(make_game(fruits=[apple], cities=[pori]))
     
     # This shouldn't happen in practice (parse_command filters), but test anyway
-    result = execute_command(engine, "unknown", [])
+    result, _ = execute_command(engine, "unknown", [])
     assert result is True
 
 
-def test_execute_command_pluralization(mock_ui, make_game, apple, pori):
+def test_execute_command_pluralization(ui_calls, make_game, apple, pori):
     """Test that pluralization works correctly in buy/sell messages."""
     game = make_game(
         fruits=[apple], 
@@ -336,125 +329,58 @@ def test_execute_command_pluralization(mock_ui, make_game, apple, pori):
     
     # Buy singular
     engine.pricing.get_price = lambda fruit, city: 100
-    result = execute_command(engine, "buy", ["apple", "1"])
-    assert "apple" in mock_ui["success"][0][0].lower()
-    assert "apples" not in mock_ui["success"][0][0].lower()
+    result, _ = execute_command(engine, "buy", ["apple", "1"])
+    assert "apple" in ui_calls.success[0].lower()
+    assert "apples" not in ui_calls.success[0].lower()
     
-    mock_ui["success"].clear()
+    ui_calls.success.clear()
     
     # Buy plural
-    result = execute_command(engine, "buy", ["apple", "2"])
-    assert "apples" in mock_ui["success"][0][0].lower()
+    result, _ = execute_command(engine, "buy", ["apple", "2"])
+    assert "apples" in ui_calls.success[0].lower()
     
-    mock_ui["success"].clear()
+    ui_calls.success.clear()
     
     # Sell singular
-    result = execute_command(engine, "sell", ["apple", "1"])
-    assert "apple" in mock_ui["success"][0][0].lower()
-    assert "apples" not in mock_ui["success"][0][0].lower()
+    result, _ = execute_command(engine, "sell", ["apple", "1"])
+    assert "apple" in ui_calls.success[0].lower()
+    assert "apples" not in ui_calls.success[0].lower()
     
-    mock_ui["success"].clear()
+    ui_calls.success.clear()
     
     # Sell plural
-    result = execute_command(engine, "sell", ["apple", "2"])
-    assert "apples" in mock_ui["success"][0][0].lower()
+    result, _ = execute_command(engine, "sell", ["apple", "2"])
+    assert "apples" in ui_calls.success[0].lower()
 
 
 # --- Test game_loop ---
 
-def test_game_loop_exits_on_quit(monkeypatch, make_game, apple, pori):
-    """Test that game loop exits when quit command is entered."""
-    game = make_game(fruits=[apple], cities=[pori])
-    engine = GameEngine(game)
-    
-    call_count = {"count": 0}
-    
-    def mock_render_game_view(engine):
-        pass
-    
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "quit"
-        return "quit"  # Shouldn't reach here
-    
-    monkeypatch.setattr("commands.render_game_view", mock_render_game_view)
-    monkeypatch.setattr("commands.Prompt.ask", mock_prompt)
-    
-    # Should return normally (not loop forever)
-    game_loop(engine)
-    assert call_count["count"] == 1
+# Each script ends in quit/exit, so the loop should consume every answer
+SCRIPTS = [
+    ["quit"],
+    ["exit"],
+    ["invalid_command", "status", "quit"],
+    ["status", "save", "help", "quit"],
+]
 
 
-def test_game_loop_exits_on_exit(monkeypatch, make_game, apple, pori):
-    """Test that game loop exits when exit command is entered."""
-    game = make_game(fruits=[apple], cities=[pori])
-    engine = GameEngine(game)
-    
-    call_count = {"count": 0}
-    
-    def mock_render_game_view(engine):
-        pass
-    
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        return "exit"
-    
-    monkeypatch.setattr("commands.render_game_view", mock_render_game_view)
-    monkeypatch.setattr("commands.Prompt.ask", mock_prompt)
-    
-    game_loop(engine)
-    assert call_count["count"] == 1
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_game_loop_scripts(script, monkeypatch, prompt_queue, game_engine):
+    """Test that game loop processes each command and returns on quit/exit."""
+    prompt_queue.extend(script)
+    monkeypatch.setattr("commands.store_game", lambda engine, path=None: None)
+
+    game_loop(game_engine)
+    assert not prompt_queue
 
 
-def test_game_loop_continues_on_invalid_command(monkeypatch, make_game, apple, pori):
-    """Test that game loop continues when invalid command is entered."""
-    game = make_game(fruits=[apple], cities=[pori])
+def test_game_loop_redraws_only_after_state_changes(ui_calls, prompt_queue, make_game, apple, pori):
+    """Test that the view is re-rendered only when a command changes state."""
+    game = make_game(fruits=[apple], cities=[pori], player_money=10000)
     engine = GameEngine(game)
-    
-    call_count = {"count": 0}
-    
-    def mock_render_game_view(engine):
-        pass
-    
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "invalid_command"
-        elif call_count["count"] == 2:
-            return "status"
-        else:
-            return "quit"
-    
-    monkeypatch.setattr("commands.render_game_view", mock_render_game_view)
-    monkeypatch.setattr("commands.Prompt.ask", mock_prompt)
-    
-    game_loop(engine)
-    assert call_count["count"] == 3  # invalid, status, quit
 
+    prompt_queue.extend(["help", "invalid_command", "buy apple 1", "status", "quit"])
 
-def test_game_loop_processes_valid_commands(monkeypatch, make_game, apple, pori):
-    """Test that game loop processes multiple valid commands."""
-    game = make_game(fruits=[apple], cities=[pori])
-    engine = GameEngine(game)
-    
-    commands = ["status", "save", "help", "quit"]
-    call_count = {"count": 0}
-    
-    def mock_render_game_view(engine):
-        pass
-    
-    def mock_prompt(prompt):
-        idx = call_count["count"]
-        call_count["count"] += 1
-        if idx < len(commands):
-            return commands[idx]
-        return "quit"
-    
-    monkeypatch.setattr("commands.render_game_view", mock_render_game_view)
-    monkeypatch.setattr("commands.Prompt.ask", mock_prompt)
-    monkeypatch.setattr("commands.store_game", lambda engine, path=None: None)
-    monkeypatch.setattr("commands.render_success", lambda msg: None)
-    
     game_loop(engine)
-    assert call_count["count"] == len(commands)
+    # Initial frame, after buy, after status
+    assert len(ui_calls.views) == 3
@@ -12,18 +12,12 @@ class TestBuying:
     """Test suite for GameEngine buy() functionality."""
     
     @pytest.fixture(autouse=True)
-    def _setup(self, make_game, apple, banana, pori):
+    def _setup(self, game_engine):
         """Set up test game with default player and inventory."""
-        self.game = make_game(
-            fruits=[apple, banana],
-            cities=[pori],
-            player_money=1000,
-            player_city=pori,
-            player_inventory={}
-        )
+        self.engine = game_engine
         
     def test_buy_succeeds_with_funds(self):
-        engine = GameEngine(self.game)
+        engine = self.engine
         initial_money = engine.player.money
         price = engine.pricing.get_price("Apple", "Pori")
         engine.buy("Apple", 1)
@@ -46,9 +40,9 @@ class TestBuying:
 
     def test_buy_fruit_not_in_current_city(self):
         """Test that buying fails when player is in a city without a market."""
-        engine = GameEngine(self.game)
-        engine.player.current_city = City(name="Helsinki", position=(1, 1), specialties={})
-        with pytest.raises(ValueError, match="No market for Helsinki"):
+        engine = self.engine
+        engine.player.current_city = City(name="Tampere", position=(1, 1), specialties={})
+        with pytest.raises(ValueError, match="No market for Tampere"):
             engine.buy("Apple", 1)
 
     def test_buy_fruit_not_in_market(self, apple, pori, make_game):
@@ -67,7 +61,7 @@ class TestBuying:
 
     def test_buy_multiple_fruits(self):
         """Test buying multiple different fruits in sequence."""
-        engine = GameEngine(self.game)
+        engine = self.engine
         init_funds = engine.player.money
         apple_price = engine.pricing.get_price("Apple", "Pori")
         banana_price = engine.pricing.get_price("Banana", "Pori")
@@ -84,16 +78,10 @@ class TestSelling:
     """Test suite for GameEngine sell() functionality."""
     
     @pytest.fixture(autouse=True)
-    def _setup(self, make_game, apple, banana, pori):
+    def _setup(self, game_engine):
         """Set up test game with player having inventory to sell."""
-        self.game = make_game(
-            fruits=[apple, banana],
-            cities=[pori],
-            player_money=1000,
-            player_city=pori,
-            player_inventory={"Apple": 1, "Banana": 1}
-        )
-        self.engine = GameEngine(self.game)
+        game_engine.player.inventory = {"Apple": 1, "Banana": 1}
+        self.engine = game_engine
 
     def test_sell_succeeds_with_inventory(self):
         """Test successful sale when player has sufficient inventory."""
@@ -132,16 +120,10 @@ class TestTraveling:
     """Test suite for GameEngine travel() functionality."""
     
     @pytest.fixture(autouse=True)
-    def _setup(self, make_game, apple, banana, pori, helsinki):
+    def _setup(self, game_engine):
         """Set up test game with multiple cities for travel testing."""
-        self.game = make_game(
-            fruits=[apple, banana],
-            cities=[pori, helsinki],
-            player_money=1000,
-            player_city=pori,
-            player_inventory={"Apple": 1, "Banana": 1}
-        )
-        self.engine = GameEngine(self.game)
+        game_engine.player.inventory = {"Apple": 1, "Banana": 1}
+        self.engine = game_engine
 
     def test_travel_succeeds_with_valid_city(self):
         """Test successful travel to a valid city."""
@@ -20,83 +20,51 @@ def test_setup_data_builds_game():
     assert game.player.current_city == game.cities[0]
 
 
-def test_start_new_game_uses_prompt_and_returns_engine(monkeypatch):
+def test_start_new_game_uses_prompt_and_returns_engine(prompt_queue):
     """Test that start_new_game prompts for name and returns GameEngine."""
-    monkeypatch.setattr("game_setup.Prompt.ask", lambda _: "Bob")
-    monkeypatch.setattr("builtins.input", lambda _: "")  # Mock input("Press Enter...")
+    prompt_queue.append("Bob")
     engine = start_new_game()
     assert isinstance(engine, GameEngine)
     assert engine.player.name == "Bob"
 
 
-def test_start_new_game_validates_player_name_length(monkeypatch, capsys):
+def test_start_new_game_validates_player_name_length(prompt_queue):
     """Test that player names must be 2-20 characters."""
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "A"  # Too short
-        elif call_count["count"] == 2:
-            return "A" * 21  # Too long
-        else:
-            return "Alice"  # Valid
-
-    monkeypatch.setattr("game_setup.Prompt.ask", mock_prompt)
-    monkeypatch.setattr("builtins.input", lambda _: "")  # Mock input("Press Enter...")
+    prompt_queue.extend(["A", "A" * 21, "Alice"])  # Too short, too long, valid
 
     engine = start_new_game()
     assert engine.player.name == "Alice"
-    assert call_count["count"] == 3  # Two invalid attempts, then valid
+    assert not prompt_queue  # Two invalid attempts, then valid
 
 
-def test_start_new_game_validates_player_name_characters(monkeypatch):
+def test_start_new_game_validates_player_name_characters(prompt_queue):
     """Test that player names only allow letters, spaces, and hyphens."""
-    call_count = {"count": 0}
-
-    def mock_prompt(prompt):
-        call_count["count"] += 1
-        if call_count["count"] == 1:
-            return "Alice123"  # Numbers not allowed
-        elif call_count["count"] == 2:
-            return "Alice@Bob"  # Special chars not allowed
-        else:
-            return "Alice-Bob"  # Valid (hyphen allowed)
-
-    monkeypatch.setattr("game_setup.Prompt.ask", mock_prompt)
-    monkeypatch.setattr("builtins.input", lambda _: "")
+    # Numbers not allowed, special chars not allowed, hyphen allowed
+    prompt_queue.extend(["Alice123", "Alice@Bob", "Alice-Bob"])
 
     engine = start_new_game()
     assert engine.player.name == "Alice-Bob"
-    assert call_count["count"] == 3
+    assert not prompt_queue
 
 
-def test_start_new_game_strips_whitespace(monkeypatch):
+def test_start_new_game_strips_whitespace(prompt_queue):
     """Test that whitespace is stripped from player names."""
-    monkeypatch.setattr("game_setup.Prompt.ask", lambda _: "  Alice  ")
-    monkeypatch.setattr("builtins.input", lambda _: "")
+    prompt_queue.append("  Alice  ")
 
     engine = start_new_game()
     assert engine.player.name == "Alice"
 
 
-def test_start_new_game_accepts_valid_names(monkeypatch):
+@pytest.mark.parametrize("name", ["Alice", "Bob Smith", "Mary-Jane", "José", "François"])
+def test_start_new_game_accepts_valid_names(name, prompt_queue):
     """Test that valid player names are accepted."""
-    test_names = ["Alice", "Bob Smith", "Mary-Jane", "José", "François"]
-
-    for name in test_names:
-        # Use default parameter to avoid closure issue
-        monkeypatch.setattr("game_setup.Prompt.ask", lambda _, n=name: n)
-        monkeypatch.setattr("builtins.input", lambda _: "")
-        engine = start_new_game()
-        assert engine.player.name == name
+    prompt_queue.append(name)
+    engine = start_new_game()
+    assert engine.player.name == name
 
 
-def test_start_new_game_shows_success_message(monkeypatch, capsys):
+def test_start_new_game_shows_success_message(prompt_queue, capsys):
     """Test that success message is shown when game starts."""
-    monkeypatch.setattr("builtins.input", lambda _: "")
-
     engine = start_new_game(player_name="Alice")
     captured = capsys.readouterr()
     assert "New game started for Alice" in captured.out or "Alice" in captured.out
-
@@ -7,13 +7,41 @@ import pytest
 from datetime import datetime
 from loguru import logger
 import json
+from types import MappingProxyType
 
 from game_engine import GameEngine
+from game_setup import start_new_game
 from persistence import serialize_game, deserialize_game, store_game, load_game
 from conftest import make_game, apple, banana, pori, helsinki
 from models import Fruit, City, Game
 
 
+# Hand-written save used by the deserialize and load tests. Read-only: the
+# top level is a mappingproxy, and tests must not mutate the nested values.
+_FIXTURE_GAME_DATA = MappingProxyType({
+    "fruits": [
+        {"name": "Apple", "base_price": 100, "emoji": "🍎", "description": "Tasty"}
+    ],
+    "cities": [
+        {"name": "Pori", "position": [0, 0], "specialties": {"Apple": 0.8}}
+    ],
+    "markets": [
+        {"city": "Pori", "prices": {"Apple": 80}}
+    ],
+    "player": {
+        "name": "TestPlayer",
+        "money": 5000,
+        "inventory": {"Apple": 10},
+        "current_city": "Pori"
+    },
+    "current_day": 3,
+    "created_at": "2025-12-31 12:00:00"
+})
+
+# The same save, encoded once at import
+_FIXTURE_JSON = json.dumps(dict(_FIXTURE_GAME_DATA)).encode("utf-8")
+
+
 def test_serialize_game_engine_state_into_json_friendly_dict(make_game, apple, banana, pori, helsinki):
     # Arrange
     game = make_game(
@@ -90,29 +118,8 @@ def test_serialize_game_engine_state_into_json_friendly_dict(make_game, apple, b
 
 
 def test_deserialize_game_reconstructs_game_from_dict():
-    # Arrange 
-    game_data = {
-        "fruits": [
-            {"name": "Apple", "base_price": 100, "emoji": "🍎", "description": "Tasty"}
-        ],
-        "cities": [
-            {"name": "Pori", "position": [0, 0], "specialties": {"Apple": 0.8}}
-        ],
-        "markets": [
-            {"city": "Pori", "prices": {"Apple": 80}}
-        ],
-        "player": {
-            "name": "TestPlayer",
-            "money": 5000,
-            "inventory": {"Apple": 10},
-            "current_city": "Pori"
-        },
-        "current_day": 3,
-        "created_at": "2025-12-31 12:00:00" 
-    }
-
     # Act
-    result = deserialize_game(game_data)
+    result = deserialize_game(_FIXTURE_GAME_DATA)
 
     # Assert
     assert isinstance(result, Game)
@@ -139,6 +146,15 @@ def test_deserialize_game_reconstructs_game_from_dict():
     assert result.current_day == 3
 
 
+def test_deserialize_game_interns_names():
+    """Test that price and inventory keys are the same string objects as the fruit names."""
+    result = deserialize_game(json.loads(_FIXTURE_JSON))
+
+    apple_name = result.fruits[0].name
+    assert next(iter(result.markets[0].prices)) is apple_name
+    assert next(iter(result.player.inventory)) is apple_name
+
+
 def test_store_game_writes_to_file(tmp_path, make_game):
     # Arrange
     save_file = tmp_path / "test_save.json"
@@ -162,33 +178,14 @@ def test_store_game_writes_to_file(tmp_path, make_game):
 
     # Assert
     assert save_file.exists()
-    content = save_file.read_text()
+    content = save_file.read_text(encoding="utf-8")
     assert "fruits" in content
 
 
 def test_load_game_reads_from_file(tmp_path):
     # Arrange
     save_file = tmp_path / "test_save.json"
-    game_data = {
-        "fruits": [
-            {"name": "Apple", "base_price": 100, "emoji": "🍎", "description": "Tasty"}
-        ],
-        "cities": [
-            {"name": "Pori", "position": [0, 0], "specialties": {"Apple": 0.8}}
-        ],
-        "markets": [
-            {"city": "Pori", "prices": {"Apple": 80}}
-        ],
-        "player": {
-            "name": "TestPlayer",
-            "money": 5000,
-            "inventory": {"Apple": 10},
-            "current_city": "Pori"
-        },
-        "current_day": 3,
-        "created_at": "2025-12-31 12:00:00" 
-    }
-    save_file.write_text(json.dumps(game_data))
+    save_file.write_bytes(_FIXTURE_JSON)
 
     # Act
     engine = load_game(path=save_file)
@@ -241,7 +238,6 @@ def test_load_game_raises_when_file_not_found(tmp_path):
 def test_store_and_load_with_default_file(tmp_path, monkeypatch):
     """Test that store and load work with default GAME_FILE path."""
     monkeypatch.setattr("persistence.GAME_FILE", tmp_path / "game.json")
-    from game_setup import start_new_game
     
     engine = start_new_game(player_name="Carol")
 
@@ -254,12 +250,9 @@ def test_store_and_load_with_default_file(tmp_path, monkeypatch):
     assert loaded_engine.game.cities[0].name == engine.game.cities[0].name
 
 
-def test_serialize_and_deserialize_are_inverse(tmp_path, monkeypatch):
+def test_serialize_and_deserialize_are_inverse(game_engine):
     """Test that serialize/deserialize roundtrip preserves all game data."""
-    monkeypatch.setattr("persistence.GAME_FILE", tmp_path / "game.json")
-    from game_setup import start_new_game
-    
-    engine = start_new_game(player_name="Dave")
+    engine = game_engine
 
     data = serialize_game(engine)
     rebuilt = deserialize_game(data)
@@ -274,7 +267,6 @@ def test_serialize_and_deserialize_are_inverse(tmp_path, monkeypatch):
 def test_load_game_shows_success_message(tmp_path, monkeypatch, capsys):
     """Test that load_game works correctly (basic functionality check)."""
     monkeypatch.setattr("persistence.GAME_FILE", tmp_path / "game.json")
-    from game_setup import start_new_game
     
     engine = start_new_game(player_name="LoadTest")
     store_game(engine)
@@ -282,4 +274,48 @@ def test_load_game_shows_success_message(tmp_path, monkeypatch, capsys):
     # Now load it
     loaded_engine = load_game()
     # Just verify it loads without error
-    assert loaded_engine.player.name == "LoadTest"
\ No newline at end of file
+    assert loaded_engine.player.name == "LoadTest"
+
+def test_serialize_game_uses_given_timestamp(game_engine):
+    """Test that created_at can be supplied and keeps the 'YYYY-MM-DD HH:MM:SS' format."""
+    result = serialize_game(game_engine, created_at=datetime(2025, 12, 31, 12, 0, 0, 123456))
+    assert result["created_at"] == "2025-12-31 12:00:00"
+
+
+def test_store_game_replaces_file_without_leaving_temp(tmp_path, game_engine):
+    """Test that store_game overwrites an existing save and cleans up its temp file."""
+    save_file = tmp_path / "game.json"
+    save_file.write_text("old save")
+
+    store_game(game_engine, path=save_file)
+
+    assert json.loads(save_file.read_text(encoding="utf-8"))["player"]["name"] == "Player"
+    assert list(tmp_path.iterdir()) == [save_file]
+
+
+def test_store_game_failure_keeps_old_save_and_removes_temp(tmp_path, monkeypatch, game_engine):
+    """Test that a failed save leaves the previous file intact and no temp file behind."""
+    save_file = tmp_path / "game.json"
+    save_file.write_text("old save")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("persistence.os.replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        store_game(game_engine, path=save_file)
+
+    assert save_file.read_text() == "old save"
+    assert list(tmp_path.iterdir()) == [save_file]
+
+
+def test_store_and_load_gzip_save(tmp_path, game_engine):
+    """Test that '.gz' saves are compressed on disk and load transparently."""
+    save_file = tmp_path / "game.json.gz"
+
+    store_game(game_engine, path=save_file)
+    loaded_engine = load_game(path=save_file)
+
+    assert save_file.read_bytes().startswith(b"\x1f\x8b")
+    assert loaded_engine.player.name == game_engine.player.name
+    assert loaded_engine.player.money == game_engine.player.money
@@ -112,3 +112,16 @@ def test_unknown_fruit_returns_zero(apple, make_city, make_game):
     game = make_game(fruits=[apple], cities=[city])
     pricing = PricingSystem(game)
     assert pricing.get_price("UnknownFruit", "Known") == 0, "Prices should be 0 for unknown fruits in a known city."
+
+
+def test_prices_are_stored_in_alphabetical_order(apple, banana, cherry, pori, make_game):
+    game = make_game(fruits=[cherry, apple, banana], cities=[pori])
+    PricingSystem(game)
+    assert list(game.markets[0].prices) == ["Apple", "Banana", "Cherry"]
+
+
+def test_get_market_returns_city_market_or_none(apple, pori, make_game):
+    game = make_game(fruits=[apple], cities=[pori])
+    pricing = PricingSystem(game)
+    assert pricing.get_market("Pori") is game.markets[0]
+    assert pricing.get_market("Atlantis") is None
@@ -4,40 +4,86 @@ Tests for ui module.
 Tests user interface rendering functions.
 """
 import pytest
-from io import StringIO
-from rich.console import Console
 
-from ui import render_main_menu, render_game_view
+import ui.rendering as rendering_module
+from ui import render_main_menu, render_game_view, render_error, render_help_menu
+from ui.rendering import _fmt_cents
 from game_setup import start_new_game
 
 
-def test_render_main_menu_outputs_menu(monkeypatch, capsys):
+def test_render_main_menu_outputs_menu(rich_capture):
     """Test that main menu renders correctly."""
     render_main_menu()
-    captured = capsys.readouterr()
-    output = captured.out
+    output = rich_capture()
     assert "Main Menu" in output
     assert "Start a new game" in output
     assert "Load a game" in output
 
 
-def test_render_game_view_shows_player_and_prices(capsys):
+def test_render_help_menu_lists_commands(rich_capture):
+    """Test that the help menu lists every in-game command."""
+    render_help_menu()
+    output = rich_capture()
+    for command in ("buy", "sell", "travel", "status", "save", "quit", "help"):
+        assert command in output
+
+
+def test_render_game_view_shows_player_and_prices(rich_capture, game_engine):
     """Test that game view shows player information and prices."""
-    buffer = StringIO()
-    test_console = Console(file=buffer, width=80, force_terminal=True, color_system=None)
+    render_game_view(game_engine)
+    output = rich_capture()
+    assert game_engine.player.name in output
+    assert "Day" in output
+    assert "Market Prices" in output
+
+
+def test_fmt_cents_formats_dollars_and_cents():
+    """Test that integer cents are formatted as dollars with thousands separators."""
+    assert _fmt_cents(0) == "$0.00"
+    assert _fmt_cents(5) == "$0.05"
+    assert _fmt_cents(114) == "$1.14"
+    assert _fmt_cents(2_000_00) == "$2,000.00"
+    assert _fmt_cents(-50) == "-$0.50"
+    assert _fmt_cents(-123456) == "-$1,234.56"
+
+
+def test_render_game_view_reuses_panels_for_unchanged_state(rich_capture):
+    """Test that redrawing an unchanged state reuses the cached panels."""
     engine = start_new_game(player_name="Viewer")
 
-    # Use monkeypatch to temporarily replace the console
-    import ui.rendering as rendering_module
-    original_console = rendering_module.console
-    rendering_module.console = test_console
-    
-    try:
-        render_game_view(engine)
-        output = buffer.getvalue()
-        assert "Viewer" in output
-        assert "Day" in output
-        assert "Market Prices" in output
-    finally:
-        rendering_module.console = original_console
+    rendering_module._build_stats_panel.cache_clear()
+    render_game_view(engine)
+    render_game_view(engine)
+    assert rendering_module._build_stats_panel.cache_info().hits == 1
+
+    engine.player.money -= 100
+    render_game_view(engine)
+    assert rendering_module._build_stats_panel.cache_info().misses == 2
+
+
+def test_render_error_shows_message_and_hint_literally(rich_capture):
+    """Test that error text containing square brackets is not parsed as markup."""
+    render_error("Unknown fruit: [apple]", hint="Usage: buy <fruit> <qty>")
+    output = rich_capture()
+    assert "Unknown fruit: [apple]" in output
+    assert "Usage: buy <fruit> <qty>" in output
+
+
+def test_render_game_view_shows_player_name_literally(rich_capture):
+    """Test that a player name with square brackets is not parsed as markup."""
+    engine = start_new_game(player_name="Viewer")
+    engine.player.name = "[red]Eve"
+
+    render_game_view(engine)
+    assert "[red]Eve" in rich_capture()
+
+
+def test_render_game_view_shows_fruit_names_literally(rich_capture, game_engine):
+    """Test that inventory and price fruit names from a save are not parsed as markup."""
+    game_engine.player.inventory["[/x]"] = 2
+    game_engine.current_market.prices["[/y]"] = 100
 
+    render_game_view(game_engine)
+    output = rich_capture()
+    assert "[/x] x2" in output
+    assert "[/y]" in output